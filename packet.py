@@ -31,19 +31,140 @@ F_AIR_PM25 = 1 << 2
 F_AIR_AQI25 = 1 << 3
 F_UV = 1 << 4
 
+# Payload fields in wire order: (flag, struct format, TelemetryPacket attribute)
+_FIELD_SPECS = (
+    (F_TEMP, "h", "temp_c"),
+    (F_PRESSURE, "I", "pressure_pa"),
+    (F_AIR_PM25, "I", "pm25_env"),
+    (F_AIR_AQI25, "I", "aqi_pm25_us"),
+    (F_UV, "H", "uv_uvi"),
+)
+_FLAGS_MASK = (1 << len(_FIELD_SPECS)) - 1
+
+# MAGIC..MSGTYPE never change, so they're copied in rather than packed
+_FIXED_PREFIX = MAGIC + bytes((VERSION, MSGTYPE_TELEMETRY))
+_FIXED_PREFIX_LEN = len(_FIXED_PREFIX)
+
+# Payload format for every combination of flags
+_PAYLOAD_FMTS = {
+    flags: "".join(fmt for flag, fmt, _ in _FIELD_SPECS if flags & flag)
+    for flags in range(_FLAGS_MASK + 1)
+}
+
+# Struct for the rest of the frame (SEQ..CRC16) for every combination of flags
+_FRAME_STRUCTS = {
+    flags: struct.Struct("<HIH" + fmt + "H") for flags, fmt in _PAYLOAD_FMTS.items()
+}
+
+# Payload Struct and the attribute each value lands in, per combination of flags
+_PAYLOAD_LAYOUTS = {
+    flags: (
+        struct.Struct("<" + fmt),
+        tuple(name for flag, _, name in _FIELD_SPECS if flags & flag),
+    )
+    for flags, fmt in _PAYLOAD_FMTS.items()
+}
 
-def crc16_ccitt_false(data: bytes) -> int:
-    crc = 0xFFFF
-    for b in data:
-        crc ^= (b << 8) & 0xFFFF
+_HEADER_STRUCT = struct.Struct("<BBHIH")
+_U16_STRUCT = struct.Struct("<H")
+
+
+def _crc16_table() -> Tuple[int, ...]:
+    table = []
+    for b in range(256):
+        crc = b << 8
         for _ in range(8):
             if crc & 0x8000:
                 crc = ((crc << 1) ^ 0x1021) & 0xFFFF
             else:
                 crc = (crc << 1) & 0xFFFF
+        table.append(crc)
+    return tuple(table)
+
+
+_CRC_TABLE = _crc16_table()
+
+
+# Optional JIT: numba compiles the same table loop to native code. Not a hard
+# dependency -- without numpy/numba we stay on the pure-Python loop.
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    _crc16_jit = None
+else:
+
+    def _crc16_tables_np() -> np.ndarray:
+        # Slicing-by-8 tables: row k is the CRC contribution of a byte followed
+        # by k zero bytes, so eight input bytes fold into the CRC per iteration.
+        # int64 entries keep numba from mixing signed/unsigned types in the XORs.
+        tables = np.empty((8, 256), dtype=np.int64)
+        tables[0] = _CRC_TABLE
+        for k in range(1, 8):
+            prev = tables[k - 1]
+            tables[k] = ((prev << 8) & 0xFFFF) ^ tables[0][prev >> 8]
+        return tables
+
+    _CRC_TABLES_NP = _crc16_tables_np()
+
+    @njit(cache=True, boundscheck=False)
+    def _crc16_jit(data):
+        t = _CRC_TABLES_NP
+        crc = 0xFFFF
+        n = data.size
+        i = 0
+        while i + 8 <= n:
+            crc = (
+                t[7, ((crc >> 8) ^ data[i]) & 0xFF]
+                ^ t[6, (crc ^ data[i + 1]) & 0xFF]
+                ^ t[5, data[i + 2]]
+                ^ t[4, data[i + 3]]
+                ^ t[3, data[i + 4]]
+                ^ t[2, data[i + 5]]
+                ^ t[1, data[i + 6]]
+                ^ t[0, data[i + 7]]
+            )
+            i += 8
+        while i < n:
+            crc = ((crc << 8) ^ t[0, ((crc >> 8) ^ data[i]) & 0xFF]) & 0xFFFF
+            i += 1
+        return crc
+
+    # Pay the compile cost at import, not on the first radio frame. numba
+    # compiles read-only (bytes, used by decode) and writable (bytearray, used
+    # by encode) arrays separately, so warm up both.
+    _crc16_jit(np.frombuffer(b"\x00", dtype=np.uint8))
+    _crc16_jit(np.frombuffer(bytearray(1), dtype=np.uint8))
+
+
+def crc16_ccitt_false(data: bytes) -> int:
+    if _crc16_jit is not None:
+        try:
+            arr = np.frombuffer(data, dtype=np.uint8)
+        except (TypeError, BufferError):
+            # Not a contiguous buffer (e.g. a list of ints): use the table loop
+            pass
+        else:
+            return int(_crc16_jit(arr))
+
+    crc = 0xFFFF
+    for b in data:
+        crc = ((crc << 8) ^ _CRC_TABLE[((crc >> 8) ^ b) & 0xFF]) & 0xFFFF
     return crc
 
 
+def _round_half_away(x: float) -> int:
+    # x - int(x) is exact, so only true halves round away from zero; adding
+    # 0.5 first would also round values just below a half (0.49999999999999994)
+    whole = int(x)
+    frac = x - whole
+    if frac >= 0.5:
+        return whole + 1
+    if frac <= -0.5:
+        return whole - 1
+    return whole
+
+
 def _clamp_u16(x: int) -> int:
     return 0 if x < 0 else 65535 if x > 65535 else x
 
@@ -56,6 +177,57 @@ def _clamp_i16(x: int) -> int:
     return -32768 if x < -32768 else 32767 if x > 32767 else x
 
 
+def encode_telemetry(
+    *,
+    seq: int,
+    unix_s: int,
+    temp_c: Optional[float] = None,
+    pressure_pa: Optional[int] = None,
+    pm25_env: Optional[int] = None,
+    aqi_pm25_us: Optional[int] = None,
+    uv_uvi: Optional[float] = None,
+) -> bytes:
+    values = []
+    flags = 0
+
+    if temp_c is not None:
+        flags |= F_TEMP
+        values.append(_clamp_i16(_round_half_away(temp_c * 100.0)))
+
+    if pressure_pa is not None:
+        flags |= F_PRESSURE
+        values.append(_clamp_u32(int(pressure_pa)))
+
+    if pm25_env is not None:
+        flags |= F_AIR_PM25
+        values.append(_clamp_u32(int(pm25_env)))
+
+    if aqi_pm25_us is not None:
+        flags |= F_AIR_AQI25
+        values.append(_clamp_u32(int(aqi_pm25_us)))
+
+    if uv_uvi is not None:
+        flags |= F_UV
+        values.append(_clamp_u16(_round_half_away(uv_uvi * 100.0)))
+
+    frame_struct = _FRAME_STRUCTS[flags]
+    buf = bytearray(_FIXED_PREFIX_LEN + frame_struct.size)
+    buf[:_FIXED_PREFIX_LEN] = _FIXED_PREFIX
+    frame_struct.pack_into(
+        buf,
+        _FIXED_PREFIX_LEN,
+        seq & 0xFFFF,
+        _clamp_u32(unix_s),
+        flags,
+        *values,
+        0,  # CRC placeholder, patched below
+    )
+
+    crc = crc16_ccitt_false(memoryview(buf)[2:-2])
+    _U16_STRUCT.pack_into(buf, len(buf) - 2, crc)
+    return bytes(buf)
+
+
 @dataclass
 class TelemetryPacket:
     seq: int
@@ -68,52 +240,25 @@ class TelemetryPacket:
     uv_uvi: Optional[float] = None
 
     def encode(self) -> bytes:
-        payload = bytearray()
-        flags = 0
-
-        if self.temp_c is not None:
-            flags |= F_TEMP
-            temp_x100 = _clamp_i16(int(round(self.temp_c * 100.0)))
-            payload += struct.pack("<h", temp_x100)
-
-        if self.pressure_pa is not None:
-            flags |= F_PRESSURE
-            payload += struct.pack("<I", _clamp_u32(int(self.pressure_pa)))
-
-        if self.pm25_env is not None:
-            flags |= F_AIR_PM25
-            payload += struct.pack("<I", _clamp_u32(int(self.pm25_env)))
-
-        if self.aqi_pm25_us is not None:
-            flags |= F_AIR_AQI25
-            payload += struct.pack("<I", _clamp_u32(int(self.aqi_pm25_us)))
-
-        if self.uv_uvi is not None:
-            flags |= F_UV
-            uv_x100 = _clamp_u16(int(round(self.uv_uvi * 100.0)))
-            payload += struct.pack("<H", uv_x100)
-
-        header = struct.pack(
-            "<BBH I H",
-            VERSION,
-            MSGTYPE_TELEMETRY,
-            self.seq & 0xFFFF,
-            _clamp_u32(self.unix_s),
-            flags & 0xFFFF,
+        return encode_telemetry(
+            seq=self.seq,
+            unix_s=self.unix_s,
+            temp_c=self.temp_c,
+            pressure_pa=self.pressure_pa,
+            pm25_env=self.pm25_env,
+            aqi_pm25_us=self.aqi_pm25_us,
+            uv_uvi=self.uv_uvi,
         )
 
-        crc = crc16_ccitt_false(header + payload)
-        return MAGIC + header + payload + struct.pack("<H", crc)
 
-
-def decode_packet(frame: bytes) -> Tuple[TelemetryPacket, dict]:
+def decode_packet(frame: bytes) -> TelemetryPacket:
     if len(frame) < 2 + 1 + 1 + 2 + 4 + 2 + 2:
         raise ValueError("frame too short")
 
     if frame[:2] != MAGIC:
         raise ValueError("bad magic")
 
-    ver, mtype, seq, unix_s, flags = struct.unpack_from("<BBH I H", frame, 2)
+    ver, mtype, seq, unix_s, flags = _HEADER_STRUCT.unpack_from(frame, 2)
 
     if ver != VERSION:
         raise ValueError("unsupported version")
@@ -121,44 +266,29 @@ def decode_packet(frame: bytes) -> Tuple[TelemetryPacket, dict]:
     if mtype != MSGTYPE_TELEMETRY:
         raise ValueError("unsupported msg type")
 
-    crc_given = struct.unpack_from("<H", frame, len(frame) - 2)[0]
-    body = frame[2:-2]
+    payload_struct, names = _PAYLOAD_LAYOUTS[flags & _FLAGS_MASK]
+    if len(frame) != 2 + _HEADER_STRUCT.size + payload_struct.size + 2:
+        raise ValueError("bad length")
+
+    mv = memoryview(frame)
+    crc_given = _U16_STRUCT.unpack_from(mv, len(mv) - 2)[0]
 
-    crc_calc = crc16_ccitt_false(body)
+    crc_calc = crc16_ccitt_false(mv[2:-2])
     if crc_calc != crc_given:
         raise ValueError("crc mismatch")
 
-    offset = 2 + struct.calcsize("<BBH I H")
-    fields = {}
-
-    def take(fmt: str):
-        nonlocal offset
-        size = struct.calcsize(fmt)
-        out = struct.unpack_from(fmt, frame, offset)
-        offset += size
-        return out[0] if len(out) == 1 else out
+    pkt = TelemetryPacket(seq=seq, unix_s=unix_s)
+    values = payload_struct.unpack_from(mv, 2 + _HEADER_STRUCT.size)
+    for name, value in zip(names, values):
+        setattr(pkt, name, value)
 
     if flags & F_TEMP:
-        fields["temp_c"] = take("<h") / 100.0
-
-    if flags & F_PRESSURE:
-        fields["pressure_pa"] = take("<I")
-
-    if flags & F_AIR_PM25:
-        fields["pm25_env"] = take("<I")
-
-    if flags & F_AIR_AQI25:
-        fields["aqi_pm25_us"] = take("<I")
+        pkt.temp_c /= 100.0
 
     if flags & F_UV:
-        fields["uv_uvi"] = take("<H") / 100.0
-
-    pkt = TelemetryPacket(
-        seq=seq,
-        unix_s=unix_s,
-    )
+        pkt.uv_uvi /= 100.0
 
-    return pkt, fields
+    return pkt
 
 
 def build_from_latest(
@@ -170,7 +300,7 @@ def build_from_latest(
     air_aqi_pm25_us: Optional[int],
     uv_uvi: Optional[float],
 ) -> bytes:
-    pkt = TelemetryPacket(
+    return encode_telemetry(
         seq=seq,
         unix_s=int(time.time()),
         temp_c=temp_c,
@@ -179,4 +309,3 @@ def build_from_latest(
         aqi_pm25_us=air_aqi_pm25_us,
         uv_uvi=uv_uvi,
     )
-    return pkt.encode()
@@ -33,6 +33,14 @@ class LoRaRadio:
 class Latest:
     """Holds latest sensor values."""
 
+    __slots__ = (
+        "temp_c",
+        "pressure_pa",
+        "air_pm25_env",
+        "air_aqi_pm25_us",
+        "uv_uvi",
+    )
+
     def __init__(self) -> None:
         self.temp_c = None
         self.pressure_pa = None
@@ -78,22 +86,51 @@ async def radio_publish_loop(
 ) -> None:
     """
     Periodically builds ONE packet from latest values and transmits over LoRa.
+    Frames go through a queue so the blocking radio.send() runs in a worker
+    thread instead of stalling the event loop.
     """
-    seq = 0
-    while True:
-        seq = (seq + 1) & 0xFFFF
-
-        frame = build_from_latest(
-            seq=seq,
-            temp_c=latest.temp_c,
-            pressure_pa=latest.pressure_pa,
-            air_pm25_env=latest.air_pm25_env,
-            air_aqi_pm25_us=latest.air_aqi_pm25_us,
-            uv_uvi=latest.uv_uvi,
-        )
-
-        radio.send(frame)
-        await asyncio.sleep(period_s)
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=4)
+
+    async def run_build():
+        seq = 0
+        # Schedule against absolute deadlines so the cadence doesn't drift by
+        # the build/queue time each period.
+        deadline = loop.time()
+        while True:
+            seq = (seq + 1) & 0xFFFF
+            deadline += period_s
+
+            # Snapshot without awaiting so subscribers can't interleave an update
+            temp_c = latest.temp_c
+            pressure_pa = latest.pressure_pa
+            air_pm25_env = latest.air_pm25_env
+            air_aqi_pm25_us = latest.air_aqi_pm25_us
+            uv_uvi = latest.uv_uvi
+
+            frame = build_from_latest(
+                seq=seq,
+                temp_c=temp_c,
+                pressure_pa=pressure_pa,
+                air_pm25_env=air_pm25_env,
+                air_aqi_pm25_us=air_aqi_pm25_us,
+                uv_uvi=uv_uvi,
+            )
+
+            await queue.put(frame)
+
+            now = loop.time()
+            if deadline < now:
+                # Fell behind (e.g. queue was full): resync instead of bursting
+                deadline = now
+            await asyncio.sleep(deadline - now)
+
+    async def run_send():
+        while True:
+            frame = await queue.get()
+            await loop.run_in_executor(None, radio.send, frame)
+
+    await asyncio.gather(run_build(), run_send())
 
 
 async def main():
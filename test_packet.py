@@ -0,0 +1,142 @@
+# test_packet.py
+
+import struct
+
+import pytest
+
+import packet
+
+
+def _crc16_table_loop(data: bytes) -> int:
+    crc = 0xFFFF
+    for b in data:
+        crc = ((crc << 8) ^ packet._CRC_TABLE[((crc >> 8) ^ b) & 0xFF]) & 0xFFFF
+    return crc
+
+
+def test_crc16_check_value():
+    assert packet.crc16_ccitt_false(b"123456789") == 0x29B1
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        bytearray(b"123456789"),
+        memoryview(b"x123456789")[1:],
+        memoryview(b"1x2x3x4x5x6x7x8x9x")[::2],  # non-contiguous
+        list(b"123456789"),
+    ],
+)
+def test_crc16_accepts_any_byte_sequence(data):
+    assert packet.crc16_ccitt_false(data) == 0x29B1
+
+
+# Golden frames produced by the original per-field struct.pack encoder
+@pytest.mark.parametrize(
+    "kwargs, frame_hex",
+    [
+        (dict(seq=1, unix_s=1), "aa55010101000100000000002c67"),
+        (dict(seq=1, unix_s=1, temp_c=1.0), "aa5501010100010000000100640009c6"),
+        (
+            dict(
+                seq=513,
+                unix_s=1700000000,
+                temp_c=-12.34,
+                pressure_pa=101325,
+                pm25_env=12,
+                aqi_pm25_us=50,
+                uv_uvi=3.21,
+            ),
+            "aa550101010200f153651f002efbcd8b01000c00000032000000410111e3",
+        ),
+    ],
+)
+def test_encode_golden_frames(kwargs, frame_hex):
+    assert packet.encode_telemetry(**kwargs).hex() == frame_hex
+    assert packet.TelemetryPacket(**kwargs).encode().hex() == frame_hex
+
+
+@pytest.mark.parametrize(
+    "temp_c, temp_x100",
+    [
+        (0.125, 13),  # exact half rounds away from zero
+        (-0.125, -13),
+        (0.004999999999999999, 0),  # just below a half rounds down
+        (-0.004999999999999999, 0),
+        (21.37, 2137),
+    ],
+)
+def test_encode_rounds_half_away_from_zero(temp_c, temp_x100):
+    frame = packet.encode_telemetry(seq=1, unix_s=1, temp_c=temp_c)
+    assert struct.unpack_from("<h", frame, 12)[0] == temp_x100
+
+
+def test_round_trip():
+    sent = packet.TelemetryPacket(
+        seq=513,
+        unix_s=1700000000,
+        temp_c=-12.34,
+        pressure_pa=101325,
+        pm25_env=12,
+        aqi_pm25_us=50,
+        uv_uvi=3.21,
+    )
+    assert packet.decode_packet(sent.encode()) == sent
+
+
+def test_round_trip_partial():
+    sent = packet.TelemetryPacket(seq=7, unix_s=42, pressure_pa=101325, uv_uvi=0.5)
+    assert packet.decode_packet(sent.encode()) == sent
+
+
+def test_decode_rejects_truncated_frame():
+    frame = packet.encode_telemetry(seq=1, unix_s=1, temp_c=1.0, pressure_pa=5)
+    # Drop the pressure field but keep a valid CRC over what remains
+    body = frame[2:-6]
+    truncated = frame[:2] + body + packet._U16_STRUCT.pack(
+        packet.crc16_ccitt_false(body)
+    )
+    with pytest.raises(ValueError, match="bad length"):
+        packet.decode_packet(truncated)
+
+
+def test_decode_rejects_over_long_frame():
+    frame = packet.encode_telemetry(seq=1, unix_s=1, temp_c=1.0)
+    body = frame[2:-2] + b"\x00\x00"
+    padded = frame[:2] + body + packet._U16_STRUCT.pack(
+        packet.crc16_ccitt_false(body)
+    )
+    with pytest.raises(ValueError, match="bad length"):
+        packet.decode_packet(padded)
+
+
+def test_decode_rejects_bad_crc():
+    frame = bytearray(packet.encode_telemetry(seq=1, unix_s=1, temp_c=1.0))
+    frame[-1] ^= 0x01
+    with pytest.raises(ValueError, match="crc mismatch"):
+        packet.decode_packet(bytes(frame))
+
+
+# The numba CRC kernel only runs when numba is installed, so check it against
+# the pure-Python table loop whenever it is available.
+requires_numba = pytest.mark.skipif(
+    packet._crc16_jit is None, reason="numba not installed"
+)
+
+
+@requires_numba
+def test_crc16_jit_check_value():
+    data = packet.np.frombuffer(b"123456789", dtype=packet.np.uint8)
+    assert packet._crc16_jit(data) == 0x29B1
+
+
+@requires_numba
+@pytest.mark.parametrize("length", range(41))
+def test_crc16_jit_matches_table_loop(length):
+    np = packet.np
+    data = bytes((i * 37 + 11) & 0xFF for i in range(length))
+    expected = _crc16_table_loop(data)
+
+    assert packet._crc16_jit(np.frombuffer(data, dtype=np.uint8)) == expected
+    writable = np.frombuffer(bytearray(data), dtype=np.uint8)
+    assert packet._crc16_jit(writable) == expected